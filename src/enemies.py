@@ -8,13 +8,44 @@ import random
 from typing import Optional, List, Tuple
 
 from src.items import Entity
+from src.fonts import get_font
+
+def _log(message: str) -> None:
+    """Send a combat message to the game's log sink, falling back to stdout."""
+    if Enemy.log_sink is not None:
+        Enemy.log_sink(message)
+    elif __debug__:
+        print(message)
+
+
+# All nine wander directions, so picking one is a single cheap
+# random.random() call and a tuple index instead of two random.randint calls
+_DIRECTIONS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+# Cumulative spawn thresholds per difficulty: a roll below the first value
+# spawns a slime, below the second a goblin, otherwise a dragon
+_SPAWN_WEIGHTS = {
+    1: (0.7, 0.95),
+    2: (0.7, 0.95),
+    3: (0.3, 0.9),
+    4: (0.3, 0.9),
+    5: (0.1, 0.6),
+}
 
 class Enemy(Entity):
     """
     Base class for all enemies in the game.
     This demonstrates inheritance from the Entity class.
     """
-    
+
+    # Optional callable that receives combat messages; when set by the game
+    # loop, hot combat paths append to it instead of writing to stdout
+    log_sink = None
+
+    # Shared frame counter advanced once per game tick, replacing a
+    # per-enemy counter increment and compare every frame
+    _frame = 0
+
     def __init__(self, name: str, health: int, attack: int, defense: int, x: int, y: int):
         """
         Initialize a new Enemy.
@@ -34,8 +65,37 @@ class Enemy(Entity):
         self.defense = defense
         self.color = (255, 0, 0)  # Red
         self.experience_value = health + attack + defense
-        self.move_counter = 0
+        # Random phase offset so direction changes are spread across frames
+        # instead of every enemy deciding on the same tick
+        self._phase = random.randint(0, 29)
         self.move_direction = (0, 0)
+
+        # Render the name label once - the name never changes
+        self._name_surface = get_font('Arial', 14).render(self.name, True, (255, 255, 255))
+        self._name_half_w = self._name_surface.get_width() // 2
+
+        # Pre-build the body and health-bar surfaces so draw is pure blits
+        self._build_surfaces()
+
+    def _build_surfaces(self) -> None:
+        """
+        Build cached surfaces for the enemy body and health bar.
+        Subclasses that change color or size should call this again afterwards.
+        """
+        # Match the display pixel format when a display exists so blits are
+        # a fast copy instead of a per-pixel conversion
+        convert = pygame.display.get_surface() is not None
+
+        self._body_surf = pygame.Surface((self.width, self.height))
+        self._body_surf.fill(self.color)
+        self._bar_bg = pygame.Surface((self.width, 5))
+        self._bar_bg.fill((255, 0, 0))
+        self._bar_fg_full = pygame.Surface((self.width, 5))
+        self._bar_fg_full.fill((0, 255, 0))
+        if convert:
+            self._body_surf = self._body_surf.convert()
+            self._bar_bg = self._bar_bg.convert()
+            self._bar_fg_full = self._bar_fg_full.convert()
         
     @property
     def health(self) -> int:
@@ -59,9 +119,13 @@ class Enemy(Entity):
         Args:
             amount: The amount of damage to take
         """
-        damage = max(1, amount - self.defense)
-        self.health -= damage
-        print(f"{self.name} takes {damage} damage!")
+        # Hot combat path: clamp inline and write _health directly rather
+        # than paying for max() dispatch and the property setter's branches
+        d = amount - self.defense
+        damage = d if d > 1 else 1
+        h = self._health - damage
+        self._health = 0 if h < 0 else h
+        _log(f"{self.name} takes {damage} damage!")
         
     def attack(self, target: 'Player') -> None:
         """
@@ -71,17 +135,20 @@ class Enemy(Entity):
             target: The target to attack (usually the player)
         """
         damage = self.attack_power
-        print(f"{self.name} attacks {target.name} for {damage} damage!")
+        _log(f"{self.name} attacks {target.name} for {damage} damage!")
         target.take_damage(damage)
         
+    @classmethod
+    def advance_frame(cls) -> None:
+        """Advance the shared AI frame counter; call once per game tick."""
+        cls._frame += 1
+
     def update(self) -> None:
         """Update the enemy's state each frame."""
         # Simple AI - move randomly every few frames
-        self.move_counter += 1
-        if self.move_counter >= 30:  # Change direction every 30 frames
-            self.move_counter = 0
+        if (Enemy._frame + self._phase) % 30 == 0:  # Change direction every 30 frames
             # Random direction: (-1, -1) to (1, 1)
-            self.move_direction = (random.randint(-1, 1), random.randint(-1, 1))
+            self.move_direction = _DIRECTIONS[int(random.random() * 9)]
             
         # Move the enemy
         self.x += self.move_direction[0]
@@ -98,23 +165,22 @@ class Enemy(Entity):
         Args:
             screen: The Pygame surface to draw on
         """
-        # Draw enemy as a rectangle
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        
-        # Draw enemy name
-        font = pygame.font.SysFont('Arial', 14)
-        name_text = font.render(self.name, True, (255, 255, 255))
-        screen.blit(name_text, (self.x + self.width // 2 - name_text.get_width() // 2, self.y - 15))
-        
-        # Draw health bar
-        health_pct = self.health / self._max_health
-        bar_width = self.width
-        health_width = bar_width * health_pct
-        
+        # Draw enemy body from the cached surface
+        screen.blit(self._body_surf, (self.x, self.y))
+
+        # Draw enemy name using the cached label surface
+        screen.blit(self._name_surface, (self.x + self.width // 2 - self._name_half_w, self.y - 15))
+
+        # Draw health bar; an untouched enemy doesn't need one at all
+        if self._health == self._max_health:
+            return
+        health_width = (self.width * self._health) // self._max_health
+
         # Health bar background (red)
-        pygame.draw.rect(screen, (255, 0, 0), (self.x, self.y - 5, bar_width, 5))
-        # Health bar foreground (green)
-        pygame.draw.rect(screen, (0, 255, 0), (self.x, self.y - 5, health_width, 5))
+        screen.blit(self._bar_bg, (self.x, self.y - 5))
+        # Health bar foreground (green), clipped to the current health
+        screen.blit(self._bar_fg_full, (self.x, self.y - 5),
+                    area=pygame.Rect(0, 0, health_width, 5))
 
 class Slime(Enemy):
     """
@@ -131,6 +197,7 @@ class Slime(Enemy):
         """
         super().__init__("Slime", health=15, attack=3, defense=1, x=x, y=y)
         self.color = (0, 255, 255)  # Cyan
+        self._build_surfaces()
         
     def attack(self, target: 'Player') -> None:
         """
@@ -142,7 +209,7 @@ class Slime(Enemy):
         """
         if random.random() < 0.3:  # 30% chance of a weaker attack
             damage = max(1, self.attack_power // 2)
-            print(f"{self.name} weakly attacks {target.name} for {damage} damage!")
+            _log(f"{self.name} weakly attacks {target.name} for {damage} damage!")
             target.take_damage(damage)
         else:
             super().attack(target)
@@ -162,6 +229,11 @@ class Goblin(Enemy):
         """
         super().__init__("Goblin", health=25, attack=6, defense=2, x=x, y=y)
         self.color = (0, 100, 0)  # Dark green
+        self._build_surfaces()
+        # Precomputed second-hit damage and a pre-bound base attack so the
+        # hot path skips the super() dispatch and per-call arithmetic
+        self._weak_damage = max(1, self.attack_power // 2)
+        self._regular_attack = Enemy.attack.__get__(self, Goblin)
         
     def attack(self, target: 'Player') -> None:
         """
@@ -170,13 +242,13 @@ class Goblin(Enemy):
         Args:
             target: The target to attack
         """
-        super().attack(target)
-        
+        self._regular_attack(target)
+
         # 20% chance to attack twice
         if random.random() < 0.2:
-            print(f"{self.name} attacks a second time!")
-            damage = max(1, self.attack_power // 2)  # Second attack is weaker
-            print(f"{self.name} attacks {target.name} for {damage} damage!")
+            _log(f"{self.name} attacks a second time!")
+            damage = self._weak_damage  # Second attack is weaker
+            _log(f"{self.name} attacks {target.name} for {damage} damage!")
             target.take_damage(damage)
 
 class Dragon(Enemy):
@@ -197,6 +269,11 @@ class Dragon(Enemy):
         self.width = 60  # Dragons are larger
         self.height = 60
         self.fire_breath_cooldown = 0
+        self._build_surfaces()
+        # Precomputed fire-breath damage and a pre-bound base attack so the
+        # hot path skips the super() dispatch and per-call arithmetic
+        self._fire_damage = self.attack_power * 2
+        self._regular_attack = Enemy.attack.__get__(self, Dragon)
         
     def update(self) -> None:
         """Update the dragon's state each frame."""
@@ -216,13 +293,13 @@ class Dragon(Enemy):
         # Check if fire breath is available
         if self.fire_breath_cooldown <= 0 and random.random() < 0.3:  # 30% chance when available
             # Fire breath attack
-            damage = self.attack_power * 2
-            print(f"{self.name} uses FIRE BREATH on {target.name} for {damage} damage!")
+            damage = self._fire_damage
+            _log(f"{self.name} uses FIRE BREATH on {target.name} for {damage} damage!")
             target.take_damage(damage)
             self.fire_breath_cooldown = 5  # Set cooldown
         else:
             # Regular attack
-            super().attack(target)
+            self._regular_attack(target)
 
 class EnemyFactory:
     """
@@ -258,31 +335,14 @@ class EnemyFactory:
         Returns:
             A randomly selected enemy
         """
-        if difficulty <= 2:
-            # Lower difficulties primarily spawn slimes
-            enemy_type = random.choices(
-                ["slime", "goblin", "dragon"],
-                weights=[0.7, 0.25, 0.05],
-                k=1
-            )[0]
-        elif difficulty <= 4:
-            # Medium difficulties spawn more goblins
-            enemy_type = random.choices(
-                ["slime", "goblin", "dragon"],
-                weights=[0.3, 0.6, 0.1],
-                k=1
-            )[0]
-        else:
-            # Higher difficulties spawn more dragons
-            enemy_type = random.choices(
-                ["slime", "goblin", "dragon"],
-                weights=[0.1, 0.5, 0.4],
-                k=1
-            )[0]
-            
-        if enemy_type == "slime":
+        # A single roll against precomputed cumulative thresholds avoids the
+        # list allocations random.choices makes on every call
+        slime_cutoff, goblin_cutoff = _SPAWN_WEIGHTS[min(max(difficulty, 1), 5)]
+        roll = random.random()
+
+        if roll < slime_cutoff:
             return EnemyFactory.create_slime(x, y)
-        elif enemy_type == "goblin":
+        elif roll < goblin_cutoff:
             return EnemyFactory.create_goblin(x, y)
         else:
             return EnemyFactory.create_dragon(x, y) 
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Fonts module providing a shared registry of Font objects.
+SysFont construction is expensive (font file lookup and parsing) and each
+Font holds an open file handle, so every (name, size) pair is created once
+and reused across the whole game.
+"""
+
+import functools
+import pygame
+
+@functools.lru_cache(maxsize=32)
+def get_font(name: str, size: int) -> pygame.font.Font:
+    """
+    Return a shared Font for the given name and size.
+
+    Args:
+        name: The system font name, e.g. 'Arial'
+        size: The point size
+
+    Returns:
+        A cached pygame Font instance
+    """
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.SysFont(name, size)
+
+@functools.lru_cache(maxsize=512)
+def render_text(text: str, size: int, color: tuple, name: str = 'Arial') -> pygame.Surface:
+    """
+    Return a cached rendered Surface for the given text.
+    Rasterizing glyphs is one of the slowest pygame operations, and most
+    labels (names, dialogue lines, UI strings) repeat frame after frame,
+    so the rendered Surface is cached and can be blitted repeatedly.
+
+    Args:
+        text: The string to render
+        size: The point size
+        color: The RGB text color
+        name: The system font name, e.g. 'Arial'
+
+    Returns:
+        A cached antialiased Surface containing the rendered text
+    """
+    surface = get_font(name, size).render(text, True, color)
+    # Match the display pixel format so repeat blits skip per-pixel
+    # conversion; skipped when no display mode is set (tests)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
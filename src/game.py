@@ -4,19 +4,33 @@ Game module containing the main Game class that handles the game loop and state.
 
 import os
 import sys
+import collections
 import pygame
-from enum import Enum, auto
+from enum import IntEnum
 
 from src.player import Player
 from src.rooms import Room, RoomFactory
 from src.ui import UI
 from src.npc import NPC
+from src.enemies import Enemy
+from src.fonts import get_font
 
-class GameState(Enum):
-    """Represents the different states the game can be in."""
-    MENU = auto()
-    PLAYING = auto()
-    DIALOGUE = auto()
+class GameState(IntEnum):
+    """
+    Represents the different states the game can be in.
+    IntEnum so state comparisons on the hot path are plain int compares.
+    """
+    MENU = 1
+    PLAYING = 2
+    DIALOGUE = 3
+
+# Module-level aliases so hot-path comparisons skip the enum attribute lookup
+MENU = GameState.MENU
+PLAYING = GameState.PLAYING
+DIALOGUE = GameState.DIALOGUE
+
+# Keys that move the player, in (up, down, left, right) order
+_MOVE_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
 
 class Game:
     """Main game class that manages the game loop and coordinates game components."""
@@ -35,7 +49,10 @@ class Game:
         
         # Game state
         self.running = True
-        self.state = GameState.MENU
+        self.state = MENU
+
+        # Only redraw when something has changed
+        self._dirty = True
         
         # Game objects
         self.player = Player("Hero", 100, 50, 10)
@@ -47,10 +64,15 @@ class Game:
         
         # UI elements
         self.ui = UI(self.screen)
+
+        # In-memory event log; combat messages go here instead of stdout so
+        # attack frames don't stall on terminal I/O
+        self._event_log = collections.deque(maxlen=64)
+        Enemy.log_sink = self._event_log.append
+        Player.log_sink = self._event_log.append
         
         # Font setup
-        pygame.font.init()
-        self.font = pygame.font.SysFont('Arial', 24)
+        self.font = get_font('Arial', 24)
         
         # Tutorial messages to teach OOP concepts
         self.tutorials = [
@@ -61,87 +83,146 @@ class Game:
             "ENCAPSULATION: The player's health is protected and can only be changed through methods."
         ]
         self.current_tutorial = 0
-        self.tutorial_timer = 0
-        self.tutorial_duration = 300  # 5 seconds at 60 FPS
-        
-        # Track key presses for continuous movement
-        self.keys_pressed = {
-            pygame.K_UP: False,
-            pygame.K_DOWN: False,
-            pygame.K_LEFT: False,
-            pygame.K_RIGHT: False,
-        }
+        # Rotation runs on the wall clock rather than loop iterations: the
+        # idle event-wait path means the loop isn't a steady 60 Hz
+        self.tutorial_duration = 5000  # milliseconds per message
+        self._next_tutorial_at = pygame.time.get_ticks() + self.tutorial_duration
+
+        # Pre-render static text once instead of rasterizing it every frame
+        self._tutorial_surfaces = [
+            self.font.render(t, True, (255, 255, 255)) for t in self.tutorials
+        ]
+        self._prompt_surface = self.font.render("Press T to talk", True, (255, 255, 0))
         
+        # Precomputed clamp bounds for keeping the player on screen
+        self._max_player_x = self.width - self.player.width
+        self._max_player_y = self.height - self.player.height
+
+        # Cached NPC proximity, recomputed only when the player moves
+        self._near_npc = (abs(self.player.x - self.npc.x) < 100 and
+                          abs(self.player.y - self.npc.y) < 100)
+
+        # Dirty-rect bookkeeping: fixed regions for the HUD pieces, plus the
+        # rects touched by the previous frame so they can be erased
+        self._card_rect = pygame.Rect(self.width - 220, 20, 200, 100)
+        self._log_rect = pygame.Rect(0, self.height - 160, self.width, 160)
+        self._prompt_rect = pygame.Rect(
+            self.width // 2 - self._prompt_surface.get_width() // 2, 50,
+            self._prompt_surface.get_width(), self._prompt_surface.get_height())
+        self._dialogue_rect = pygame.Rect(
+            self.width // 2 - 300, self.height - 220, 600, 200)
+        self._prev_rects = []
+        self._full_redraw = True
+
     def handle_events(self):
         """Process all game events."""
-        for event in pygame.event.get():
+        keys = pygame.key.get_pressed()
+        if any(keys[k] for k in _MOVE_KEYS):
+            events = pygame.event.get()
+        else:
+            # Nothing is held down, so sleep until an event arrives (or a
+            # short timeout) instead of spinning the loop at full speed
+            first = pygame.event.wait(100)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
-            
+
             if event.type == pygame.KEYDOWN:
+                self._dirty = True
                 if event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.DIALOGUE:
+                    if self.state == DIALOGUE:
                         self.npc.end_dialogue()
-                        self.state = GameState.PLAYING
+                        self.state = PLAYING
                     else:
                         self.running = False
                 
-                if self.state == GameState.MENU and event.key == pygame.K_RETURN:
-                    self.state = GameState.PLAYING
+                if self.state == MENU and event.key == pygame.K_RETURN:
+                    self.state = PLAYING
                 
-                elif self.state == GameState.PLAYING:
-                    # Track directional key presses for continuous movement
-                    if event.key in self.keys_pressed:
-                        self.keys_pressed[event.key] = True
-                    
+                elif self.state == PLAYING:
                     # Check for dialogue initiation
                     if event.key == pygame.K_t:
                         # Check if player is close enough to NPC
-                        dx = abs(self.player.x - self.npc.x)
-                        dy = abs(self.player.y - self.npc.y)
-                        if dx < 100 and dy < 100:  # Within interaction range
-                            self.state = GameState.DIALOGUE
+                        if self._near_npc:  # Within interaction range
+                            self.state = DIALOGUE
                             self.npc.start_dialogue()
                 
-                elif self.state == GameState.DIALOGUE:
+                elif self.state == DIALOGUE:
                     self.npc.handle_input(event)
             
             elif event.type == pygame.KEYUP:
-                # Stop tracking key when released
-                if event.key in self.keys_pressed:
-                    self.keys_pressed[event.key] = False
+                self._dirty = True
     
     def update(self):
         """Update the game state."""
-        if self.state == GameState.PLAYING:
-            # Update tutorial messages
-            self.tutorial_timer += 1
-            if self.tutorial_timer > self.tutorial_duration:
-                self.tutorial_timer = 0
+        if self.state == PLAYING:
+            # Advance the shared enemy AI tick once per frame
+            Enemy.advance_frame()
+
+            # Update tutorial messages against the wall-clock deadline
+            now = pygame.time.get_ticks()
+            if now >= self._next_tutorial_at:
+                self._next_tutorial_at = now + self.tutorial_duration
                 self.current_tutorial = (self.current_tutorial + 1) % len(self.tutorials)
-            
-            # Handle continuous movement based on keys being pressed
-            if self.keys_pressed[pygame.K_UP]:
-                self.player.move(0, -1)
-            if self.keys_pressed[pygame.K_DOWN]:
-                self.player.move(0, 1)
-            if self.keys_pressed[pygame.K_LEFT]:
-                self.player.move(-1, 0)
-            if self.keys_pressed[pygame.K_RIGHT]:
-                self.player.move(1, 0)
-            
-            # Keep player within screen bounds
-            self.player.x = max(0, min(self.player.x, self.width - self.player.width))
-            self.player.y = max(0, min(self.player.y, self.height - self.player.height))
+                self._dirty = True
+
+            # Handle continuous movement based on keys being held down;
+            # get_pressed is a C-backed array, so no KEYDOWN/KEYUP
+            # bookkeeping is needed and keys can't stick on focus loss
+            keys = pygame.key.get_pressed()
+            dx = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+            dy = keys[pygame.K_DOWN] - keys[pygame.K_UP]
+            if dx or dy:
+                self._dirty = True
+                self.player.move(dx, dy)
+
+                # Keep player within screen bounds
+                self.player.x = max(0, min(self.player.x, self._max_player_x))
+                self.player.y = max(0, min(self.player.y, self._max_player_y))
+
+                # The NPC is stationary, so proximity only changes on movement
+                self._near_npc = (abs(self.player.x - self.npc.x) < 100 and
+                                  abs(self.player.y - self.npc.y) < 100)
     
+    def _dynamic_rects(self):
+        """Bounding rects of everything that can change between frames."""
+        # Sprites get padding for the name label drawn above and around them
+        rects = [
+            pygame.Rect(self.player.x - 40, self.player.y - 25,
+                        self.player.width + 80, self.player.height + 30),
+            pygame.Rect(self.npc.x - 40, self.npc.y - 25,
+                        self.npc.width + 80, self.npc.height + 30),
+            self._card_rect,
+            self._log_rect,
+        ]
+        if self._near_npc:
+            rects.append(self._prompt_rect)
+        if self.npc.dialogue_active:
+            rects.append(self._dialogue_rect)
+        return rects
+
     def render(self):
         """Render the game screen."""
-        if self.state == GameState.MENU:
+        if self.state == MENU:
             self.ui.draw_menu()
+            pygame.display.flip()
+            # Leaving the menu later requires repainting the whole scene
+            self._full_redraw = True
+            return
         else:
-            # Draw the current room
-            self.current_room.draw(self.screen)
-            
+            if self._full_redraw:
+                # Draw the current room
+                self.current_room.draw(self.screen)
+            else:
+                # Erase only the regions that were dynamic last frame
+                background = self.current_room.background_color
+                for rect in self._prev_rects:
+                    self.screen.fill(background, rect)
+
             # Draw the NPC
             self.npc.draw(self.screen)
             
@@ -150,26 +231,34 @@ class Game:
             
             # Draw the UI elements
             self.ui.draw_player_stats(self.player)
+            self.ui.draw_event_log(self._event_log)
             
             # Draw tutorial message (only when not in dialogue)
-            if self.state == GameState.PLAYING:
-                tutorial_text = self.font.render(self.tutorials[self.current_tutorial], True, (255, 255, 255))
+            if self.state == PLAYING:
+                tutorial_text = self._tutorial_surfaces[self.current_tutorial]
                 self.screen.blit(tutorial_text, (20, self.height - 40))
-                
+
                 # Draw interaction prompt when near NPC
-                dx = abs(self.player.x - self.npc.x)
-                dy = abs(self.player.y - self.npc.y)
-                if dx < 100 and dy < 100:
-                    prompt_text = self.font.render("Press T to talk", True, (255, 255, 0))
+                if self._near_npc:
+                    prompt_text = self._prompt_surface
                     self.screen.blit(prompt_text, (self.width // 2 - prompt_text.get_width() // 2, 50))
-        
-        # Update the display
-        pygame.display.flip()
+
+            # Push only the changed regions to the display; a full flip is
+            # needed just after a state transition repaints everything
+            current_rects = self._dynamic_rects()
+            if self._full_redraw:
+                pygame.display.flip()
+                self._full_redraw = False
+            else:
+                pygame.display.update(self._prev_rects + current_rects)
+            self._prev_rects = current_rects
     
     def run(self):
         """Main game loop."""
         while self.running:
             self.handle_events()
             self.update()
-            self.render()
+            if self._dirty:
+                self.render()
+                self._dirty = False
             self.clock.tick(self.FPS) 
\ No newline at end of file
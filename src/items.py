@@ -5,13 +5,19 @@ This module demonstrates inheritance and polymorphism through different item typ
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Any, Dict, List, Optional
+
+from src.fonts import render_text
 
 class Entity(ABC):
     """
     Abstract base class for all game entities that have a position and can be drawn.
     """
-    
+
+    # Slots keep per-entity memory small and make x/y/width/height access
+    # a fixed-offset load instead of a dict lookup
+    __slots__ = ('name', 'x', 'y', 'width', 'height')
+
     def __init__(self, name: str, x: int, y: int, width: int, height: int):
         """
         Initialize a new Entity.
@@ -43,7 +49,10 @@ class Item(Entity):
     """
     Base class for all items in the game.
     """
-    
+
+    __slots__ = ('description', 'consumable', 'color',
+                 '_label_surface', '_label_offset', '_composite')
+
     def __init__(self, name: str, description: str, x: int, y: int):
         """
         Initialize a new Item.
@@ -58,7 +67,37 @@ class Item(Entity):
         self.description = description
         self.consumable = True
         self.color = (255, 255, 0)  # Default color: yellow
-        
+        # Label surface and centering offset, built lazily on first draw
+        # (the font subsystem may not be initialized at construction time)
+        self._label_surface: Optional[pygame.Surface] = None
+        self._label_offset = (0, 0)
+        self._composite: Optional[pygame.Surface] = None
+
+    def _get_label(self) -> pygame.Surface:
+        """Return the cached one-letter label surface, building it once."""
+        if self._label_surface is None:
+            surf = render_text(self.name[0], 12, (0, 0, 0))
+            self._label_surface = surf
+            self._label_offset = (self.width // 2 - surf.get_width() // 2,
+                                  self.height // 2 - surf.get_height() // 2)
+        return self._label_surface
+
+    def _get_composite(self) -> pygame.Surface:
+        """
+        Return the cached item tile (colored box with the letter label
+        composited on top), building it on first use.
+        """
+        if self._composite is None:
+            composite = pygame.Surface((self.width, self.height))
+            composite.fill(self.color)
+            composite.blit(self._get_label(), self._label_offset)
+            # Opaque tile: convert() to the display format when possible so
+            # the per-frame blit is a straight copy
+            if pygame.display.get_surface() is not None:
+                composite = composite.convert()
+            self._composite = composite
+        return self._composite
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draw the item on the screen.
@@ -66,13 +105,8 @@ class Item(Entity):
         Args:
             screen: The Pygame surface to draw on
         """
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        
-        # Draw a small label
-        font = pygame.font.SysFont('Arial', 12)
-        name_text = font.render(self.name[0], True, (0, 0, 0))
-        screen.blit(name_text, (self.x + self.width // 2 - name_text.get_width() // 2, 
-                                self.y + self.height // 2 - name_text.get_height() // 2))
+        # One blit of the cached box-plus-label composite
+        screen.blit(self._get_composite(), (self.x, self.y))
         
     def use(self, player: 'Player') -> bool:
         """
@@ -101,7 +135,9 @@ class HealingPotion(Item):
     This class demonstrates inheritance from the Item class and polymorphism by
     overriding the use method.
     """
-    
+
+    __slots__ = ('healing_amount',)
+
     def __init__(self, healing_amount: int, x: int, y: int):
         """
         Initialize a new HealingPotion.
@@ -142,7 +178,9 @@ class Weapon(Item):
     """
     A weapon that increases the player's attack power when equipped.
     """
-    
+
+    __slots__ = ('attack_bonus',)
+
     def __init__(self, name: str, attack_bonus: int, x: int, y: int):
         """
         Initialize a new Weapon.
@@ -182,7 +220,9 @@ class Armor(Item):
     """
     Armor that increases the player's defense when equipped.
     """
-    
+
+    __slots__ = ('defense_bonus',)
+
     def __init__(self, name: str, defense_bonus: int, x: int, y: int):
         """
         Initialize a new Armor.
@@ -222,7 +262,9 @@ class Key(Item):
     """
     A key that can unlock a specific door or chest.
     """
-    
+
+    __slots__ = ('target_id',)
+
     def __init__(self, target_id: str, x: int, y: int):
         """
         Initialize a new Key.
@@ -256,41 +298,59 @@ class Key(Item):
         print(f"You need to find the {self.target_id} to use this key.")
         return False
 
+def draw_items(screen: pygame.Surface, items: List['Item']) -> None:
+    """
+    Draw a collection of items with a single batched blit call.
+
+    Surface.blits hands the whole sequence to SDL in one C-level loop,
+    avoiding a Python-level draw call per item.
+
+    Args:
+        screen: The Pygame surface to draw on
+        items: The items to draw
+    """
+    if items:
+        screen.blits([(item._get_composite(), (item.x, item.y)) for item in items])
+
+# Per-tier weapon and armor tables, indexed by tier - 1. Module-level
+# constants so the factory methods do not rebuild a dict on every call
+_WEAPONS = (
+    ("Wooden Sword", 5),
+    ("Iron Sword", 10),
+    ("Steel Sword", 15),
+    ("Mythril Blade", 20),
+    ("Legendary Sword", 30),
+)
+
+_ARMORS = (
+    ("Leather Armor", 2),
+    ("Chain Mail", 5),
+    ("Plate Armor", 8),
+    ("Mythril Armor", 12),
+    ("Legendary Armor", 20),
+)
+
 class ItemFactory:
     """
     A factory class for creating items.
     This demonstrates the Factory design pattern.
     """
-    
+
     @staticmethod
     def create_healing_potion(x: int, y: int, amount: int = 20) -> HealingPotion:
         """Create a healing potion."""
         return HealingPotion(amount, x, y)
-        
+
     @staticmethod
     def create_weapon(x: int, y: int, tier: int = 1) -> Weapon:
         """Create a weapon based on tier."""
-        weapons = {
-            1: ("Wooden Sword", 5),
-            2: ("Iron Sword", 10),
-            3: ("Steel Sword", 15),
-            4: ("Mythril Blade", 20),
-            5: ("Legendary Sword", 30)
-        }
-        name, bonus = weapons.get(tier, weapons[1])
+        name, bonus = _WEAPONS[tier - 1 if 1 <= tier <= len(_WEAPONS) else 0]
         return Weapon(name, bonus, x, y)
-        
+
     @staticmethod
     def create_armor(x: int, y: int, tier: int = 1) -> Armor:
         """Create armor based on tier."""
-        armors = {
-            1: ("Leather Armor", 2),
-            2: ("Chain Mail", 5),
-            3: ("Plate Armor", 8),
-            4: ("Mythril Armor", 12),
-            5: ("Legendary Armor", 20)
-        }
-        name, bonus = armors.get(tier, armors[1])
+        name, bonus = _ARMORS[tier - 1 if 1 <= tier <= len(_ARMORS) else 0]
         return Armor(name, bonus, x, y)
         
     @staticmethod
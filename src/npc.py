@@ -2,12 +2,78 @@
 NPC module for non-player characters that can engage in dialogue.
 """
 
+import functools
+import re
+from collections import deque
+
 import pygame
 from typing import List, Optional
 
+from src.fonts import get_font, render_text
+
+# Keyword -> response tag, listed in priority order: when a message contains
+# keywords from several categories, the earliest category here wins (matching
+# the order of the old if/elif cascade)
+_KEYWORD_TAGS = (
+    ('hello', 'greeting'), ('hi', 'greeting'),
+    ('how are you', 'wellbeing'),
+    ('bye', 'farewell'), ('goodbye', 'farewell'),
+    ('name', 'name'),
+    ('help', 'help'),
+    ('class', 'oop'), ('object', 'oop'),
+)
+
+_KEYWORD_TAG = dict(_KEYWORD_TAGS)
+
+_TAG_PRIORITY: dict = {}
+for _keyword, _tag in _KEYWORD_TAGS:
+    _TAG_PRIORITY.setdefault(_tag, len(_TAG_PRIORITY))
+
+# One compiled alternation scans the message left to right in a single pass
+# instead of one substring search per keyword
+_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword, _ in _KEYWORD_TAGS))
+
+# Response templates keyed by tag; '{name}' is filled with the NPC's name
+_TEMPLATES = {
+    'greeting': "{name}: Hello! Nice to meet you!",
+    'wellbeing': "{name}: I'm doing well, thanks for asking!",
+    'farewell': "{name}: Goodbye! Take care!",
+    'name': "{name}: My name is {name}, as you can see above my head!",
+    'help': "{name}: I'm here to help you learn about Object-Oriented Programming!",
+    'oop': "{name}: Yes! I'm an object created from the NPC class, just like you're an object from the Player class!",
+    'default': "{name}: Interesting... Tell me more about that!",
+}
+
+@functools.lru_cache(maxsize=256)
+def _classify(message: str) -> str:
+    """
+    Return the response tag for a lowercased message.
+    Chat input is highly repetitive ("hi", "hello", "bye"), so the whole
+    classification is memoized on the message string.
+    """
+    # Single scan over the message; keep the highest-priority tag found
+    tag = 'default'
+    best = len(_TAG_PRIORITY)
+    for match in _KEYWORD_RE.finditer(message):
+        priority = _TAG_PRIORITY[_KEYWORD_TAG[match.group()]]
+        if priority < best:
+            best = priority
+            tag = _KEYWORD_TAG[match.group()]
+    return tag
+
 class NPC:
     """A non-player character that can engage in dialogue with the player."""
-    
+
+    # Slots keep the instance compact and speed up per-frame attribute access
+    __slots__ = ('name', 'x', 'y', 'width', 'height', 'sprite',
+                 'dialogue_active', 'current_message', 'messages',
+                 '_dialogue_bg', '_dialogue_bg_size', '_dialogue_rect',
+                 '_history_pos', '_prompt_pos', '_instructions_pos')
+
+    # All NPCs share one sprite surface; the pixel art is identical for
+    # every instance and never mutated after construction
+    _shared_sprite: Optional[pygame.Surface] = None
+
     def __init__(self, name: str, x: int, y: int):
         """
         Initialize a new NPC.
@@ -25,12 +91,21 @@ class NPC:
         self.sprite = self._create_pixel_person()
         self.dialogue_active = False
         self.current_message = ""
-        self.messages = []  # Store conversation history
+        # Conversation history; a bounded deque keeps long chats from
+        # growing memory without limit
+        self.messages = deque(maxlen=20)
+        # Dialogue box background and layout, built lazily for the current
+        # screen size and rebuilt only if that size changes
+        self._dialogue_bg: Optional[pygame.Surface] = None
+        self._dialogue_bg_size = (0, 0)
         
-    def _create_pixel_person(self) -> pygame.Surface:
+    @classmethod
+    def _create_pixel_person(cls) -> pygame.Surface:
         """Create a pixelated person sprite with different colors than the player."""
-        sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
+        if cls._shared_sprite is not None:
+            return cls._shared_sprite
+        sprite = pygame.Surface((32, 48), pygame.SRCALPHA)
+
         # Colors - using different colors than the player
         skin_color = (255, 218, 185)  # Peach
         shirt_color = (220, 20, 60)   # Crimson red
@@ -49,7 +124,13 @@ class NPC:
         # Legs (6x16 pixels each)
         pygame.draw.rect(sprite, pants_color, (10, 24, 6, 20))  # Left leg
         pygame.draw.rect(sprite, pants_color, (16, 24, 6, 20))  # Right leg
-        
+
+        # Match the display pixel format so blits skip per-pixel conversion;
+        # fall back to the raw surface when no display mode is set (tests)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+
+        cls._shared_sprite = sprite
         return sprite
         
     def draw(self, screen: pygame.Surface) -> None:
@@ -63,49 +144,95 @@ class NPC:
         screen.blit(self.sprite, (self.x, self.y))
         
         # Draw NPC name above sprite
-        font = pygame.font.SysFont('Arial', 18)
-        name_text = font.render(self.name, True, (255, 255, 255))
+        name_text = render_text(self.name, 18, (255, 255, 255))
         screen.blit(name_text, (self.x + self.width // 2 - name_text.get_width() // 2, self.y - 20))
         
         # If dialogue is active, draw the dialogue box
         if self.dialogue_active:
             self._draw_dialogue_box(screen)
             
-    def _draw_dialogue_box(self, screen: pygame.Surface) -> None:
-        """Draw the dialogue box with conversation history and input prompt."""
-        # Create dialogue box background
+    def _build_dialogue_layout(self, screen: pygame.Surface) -> None:
+        """
+        Build the dialogue box background surface and the fixed layout
+        positions for the current screen size. The geometry only depends on
+        the screen dimensions, so this runs once per resize rather than
+        every frame.
+        """
+        self._dialogue_bg_size = screen.get_size()
         box_width = 600
         box_height = 200
         box_x = screen.get_width() // 2 - box_width // 2
         box_y = screen.get_height() - box_height - 20
-        
+
+        # Alpha baked into the RGBA pixels keeps the blit on SDL's optimized
+        # per-pixel path; convert_alpha matches the display format (skipped
+        # when no display exists)
+        dialogue_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        dialogue_surface.fill((40, 40, 40, 220))
+        if pygame.display.get_surface() is not None:
+            dialogue_surface = dialogue_surface.convert_alpha()
+        self._dialogue_bg = dialogue_surface
+
+        self._dialogue_rect = pygame.Rect(box_x, box_y, box_width, box_height)
+        self._history_pos = (box_x + 20, box_y + 20)
+        self._prompt_pos = (box_x + 20, box_y + box_height - 30)
+        inst_text = render_text("Press ENTER to send, ESC to exit dialogue", 18, (200, 200, 200))
+        self._instructions_pos = (box_x + box_width - inst_text.get_width() - 20,
+                                  box_y + box_height - 30)
+
+    def _draw_dialogue_box(self, screen: pygame.Surface) -> None:
+        """Draw the dialogue box with conversation history and input prompt."""
+        # Rebuild the cached background and layout only when the screen
+        # size changes
+        if screen.get_size() != self._dialogue_bg_size:
+            self._build_dialogue_layout(screen)
+
         # Draw semi-transparent background
-        dialogue_surface = pygame.Surface((box_width, box_height))
-        dialogue_surface.set_alpha(220)
-        dialogue_surface.fill((40, 40, 40))
-        screen.blit(dialogue_surface, (box_x, box_y))
-        
+        screen.blit(self._dialogue_bg, self._dialogue_rect.topleft)
+
         # Draw border
-        pygame.draw.rect(screen, (100, 100, 100), (box_x, box_y, box_width, box_height), 2)
-        
-        # Draw conversation history
-        font = pygame.font.SysFont('Arial', 18)
-        y_offset = 20
-        for message in self.messages[-5:]:  # Show last 5 messages
-            text = font.render(message, True, (255, 255, 255))
-            screen.blit(text, (box_x + 20, box_y + y_offset))
-            y_offset += 25
-            
-        # Draw input prompt
+        pygame.draw.rect(screen, (100, 100, 100), self._dialogue_rect, 2)
+
+        # Draw conversation history; lines repeat across frames, so the
+        # rendered surfaces come from the shared text cache
+        x, y = self._history_pos
+        for message in list(self.messages)[-5:]:  # Show last 5 messages
+            screen.blit(render_text(message, 18, (255, 255, 255)), (x, y))
+            y += 25
+
+        # Draw input prompt (changes as the player types, so rendered fresh)
         prompt = f"> {self.current_message}_"
-        prompt_text = font.render(prompt, True, (0, 255, 0))
-        screen.blit(prompt_text, (box_x + 20, box_y + box_height - 30))
-        
-        # Draw instructions
-        instructions = "Press ENTER to send, ESC to exit dialogue"
-        inst_text = font.render(instructions, True, (200, 200, 200))
-        screen.blit(inst_text, (box_x + box_width - inst_text.get_width() - 20, box_y + box_height - 30))
+        prompt_text = get_font('Arial', 18).render(prompt, True, (0, 255, 0))
+        screen.blit(prompt_text, self._prompt_pos)
+
+        # Draw instructions (constant string, served from the text cache)
+        inst_text = render_text("Press ENTER to send, ESC to exit dialogue", 18, (200, 200, 200))
+        screen.blit(inst_text, self._instructions_pos)
         
+    def append_to_message(self, text: str) -> None:
+        """
+        Append text to the message being composed.
+
+        Fast path for adding several characters at once (pasted or
+        programmatic input) without building a keyboard event per
+        character.
+
+        Args:
+            text: The text to append
+        """
+        if self.dialogue_active:
+            self.current_message += text
+
+    def handle_input_batch(self, events: List[pygame.event.Event]) -> None:
+        """
+        Handle a sequence of buffered keyboard events in one call.
+
+        Args:
+            events: The events to process, in order
+        """
+        for event in events:
+            self.handle_input(event)
+
     def handle_input(self, event: pygame.event.Event) -> None:
         """Handle keyboard input for dialogue."""
         if not self.dialogue_active:
@@ -125,22 +252,8 @@ class NPC:
                 
     def _respond_to_message(self, message: str) -> None:
         """Generate a response to the player's message."""
-        message = message.lower()
-        
-        if "hello" in message or "hi" in message:
-            self.messages.append(f"{self.name}: Hello! Nice to meet you!")
-        elif "how are you" in message:
-            self.messages.append(f"{self.name}: I'm doing well, thanks for asking!")
-        elif "bye" in message or "goodbye" in message:
-            self.messages.append(f"{self.name}: Goodbye! Take care!")
-        elif "name" in message:
-            self.messages.append(f"{self.name}: My name is {self.name}, as you can see above my head!")
-        elif "help" in message:
-            self.messages.append(f"{self.name}: I'm here to help you learn about Object-Oriented Programming!")
-        elif "class" in message or "object" in message:
-            self.messages.append(f"{self.name}: Yes! I'm an object created from the NPC class, just like you're an object from the Player class!")
-        else:
-            self.messages.append(f"{self.name}: Interesting... Tell me more about that!")
+        tag = _classify(message.lower())
+        self.messages.append(_TEMPLATES[tag].format(name=self.name))
             
     def start_dialogue(self) -> None:
         """Start a dialogue session."""
@@ -5,12 +5,40 @@ Player module with the Player class that handles player attributes, inventory, a
 import pygame
 from typing import List, Optional
 
+from src.fonts import render_text
+
+# Fixed number of inventory slots; a preallocated slot array with a free
+# list keeps add/remove/use at O(1) instead of shifting list tails around
+INVENTORY_CAPACITY = 10
+
+def _log(message: str) -> None:
+    """Send a combat message to the game's log sink, falling back to stdout."""
+    if Player.log_sink is not None:
+        Player.log_sink(message)
+    elif __debug__:
+        print(message)
+
+
 class Player:
     """
     Player class representing the character controlled by the user.
     This class demonstrates encapsulation by protecting attributes like health.
     """
-    
+
+    # Slots keep the instance compact and speed up the attribute access
+    # that happens every frame (position, size, stats)
+    __slots__ = ('name', '_health', '_max_health', 'x', 'y', 'width', 'height',
+                 'inventory', '_free_slots', 'speed', 'attack_power', 'defense',
+                 'level', 'experience', 'experience_to_level', 'sprite')
+
+    # All players share one sprite surface; the pixel art is identical for
+    # every instance and never mutated after construction
+    _shared_sprite: Optional[pygame.Surface] = None
+
+    # Where combat messages go; the game installs its event-log append here
+    # so hot paths buffer a string instead of hitting stdout
+    log_sink = None
+
     def __init__(self, name: str, health: int, x: int = 400, y: int = 300):
         """
         Initialize a new Player instance.
@@ -28,7 +56,10 @@ class Player:
         self.y = y
         self.width = 32  # Smaller size for pixel art
         self.height = 48  # Taller than wide for human proportion
-        self.inventory = []
+        # Fixed-size slot array; empty slots hold None and their indices
+        # live on the free list (reversed so slot 0 is handed out first)
+        self.inventory = [None] * INVENTORY_CAPACITY
+        self._free_slots = list(range(INVENTORY_CAPACITY - 1, -1, -1))
         self.speed = 5
         self.attack_power = 10
         self.defense = 5
@@ -39,10 +70,13 @@ class Player:
         # Create pixelated person sprite
         self.sprite = self._create_pixel_person()
         
-    def _create_pixel_person(self) -> pygame.Surface:
+    @classmethod
+    def _create_pixel_person(cls) -> pygame.Surface:
         """Create a pixelated person sprite."""
-        sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
+        if cls._shared_sprite is not None:
+            return cls._shared_sprite
+        sprite = pygame.Surface((32, 48), pygame.SRCALPHA)
+
         # Colors
         skin_color = (255, 218, 185)  # Peach
         shirt_color = (30, 144, 255)  # Dodger blue
@@ -61,7 +95,13 @@ class Player:
         # Legs (6x16 pixels each)
         pygame.draw.rect(sprite, pants_color, (10, 24, 6, 20))  # Left leg
         pygame.draw.rect(sprite, pants_color, (16, 24, 6, 20))  # Right leg
-        
+
+        # Match the display pixel format so blits skip per-pixel conversion;
+        # fall back to the raw surface when no display mode is set (tests)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+
+        cls._shared_sprite = sprite
         return sprite
         
     @property
@@ -81,14 +121,16 @@ class Player:
             
     def take_damage(self, amount: int) -> None:
         """Reduce the player's health by the given amount."""
-        damage = max(1, amount - self.defense)
+        # Conditional expression instead of max() dispatch on the combat path
+        d = amount - self.defense
+        damage = d if d > 1 else 1
         self.health -= damage
-        print(f"{self.name} takes {damage} damage!")
+        _log(f"{self.name} takes {damage} damage!")
         
     def heal(self, amount: int) -> None:
         """Increase the player's health by the given amount."""
         self.health += amount
-        print(f"{self.name} heals for {amount} health!")
+        _log(f"{self.name} heals for {amount} health!")
         
     def move(self, dx: int, dy: int) -> None:
         """
@@ -103,22 +145,36 @@ class Player:
         self.x += dx * self.speed
         self.y += dy * self.speed
         
-    def add_to_inventory(self, item: 'Item') -> None:
-        """Add an item to the player's inventory."""
-        self.inventory.append(item)
-        
+    def add_to_inventory(self, item: 'Item') -> bool:
+        """
+        Add an item to the first free inventory slot.
+
+        Returns:
+            bool: True if the item was stored, False if the inventory is full
+        """
+        if not self._free_slots:
+            return False
+        self.inventory[self._free_slots.pop()] = item
+        return True
+
     def remove_from_inventory(self, item: 'Item') -> None:
         """Remove an item from the player's inventory."""
-        if item in self.inventory:
-            self.inventory.remove(item)
-            
+        for i, slot in enumerate(self.inventory):
+            if slot is item:
+                self.inventory[i] = None
+                self._free_slots.append(i)
+                return
+
     def use_item(self, item_index: int) -> bool:
-        """Use an item from the inventory."""
+        """Use the item in the given inventory slot."""
         if 0 <= item_index < len(self.inventory):
             item = self.inventory[item_index]
+            if item is None:
+                return False
             result = item.use(self)
             if item.consumable:
-                self.inventory.pop(item_index)
+                self.inventory[item_index] = None
+                self._free_slots.append(item_index)
             return result
         return False
         
@@ -143,7 +199,7 @@ class Player:
         Add experience to the player and level up if enough experience is gained.
         """
         self.experience += amount
-        print(f"{self.name} gains {amount} experience!")
+        _log(f"{self.name} gains {amount} experience!")
         
         # Check for level up
         if self.experience >= self.experience_to_level:
@@ -160,19 +216,17 @@ class Player:
         self.attack_power += 2
         self.defense += 1
         self.experience_to_level = int(self.experience_to_level * 1.5)
-        print(f"{self.name} leveled up to level {self.level}!")
+        _log(f"{self.name} leveled up to level {self.level}!")
         
     def collides_with(self, entity: 'Entity') -> bool:
         """
         Check if the player collides with another entity.
         """
-        # Simple box collision
-        return (
-            self.x < entity.x + entity.width and
-            self.x + self.width > entity.x and
-            self.y < entity.y + entity.height and
-            self.y + self.height > entity.y
-        )
+        # Simple box collision; attributes are read into locals once so the
+        # comparison chain runs on fast local loads
+        sx, sy, sw, sh = self.x, self.y, self.width, self.height
+        ex, ey, ew, eh = entity.x, entity.y, entity.width, entity.height
+        return sx < ex + ew and sx + sw > ex and sy < ey + eh and sy + sh > ey
         
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -185,6 +239,5 @@ class Player:
         screen.blit(self.sprite, (self.x, self.y))
         
         # Draw player name above sprite
-        font = pygame.font.SysFont('Arial', 18)
-        name_text = font.render(self.name, True, (255, 255, 255))
+        name_text = render_text(self.name, 18, (255, 255, 255))
         screen.blit(name_text, (self.x + self.width // 2 - name_text.get_width() // 2, self.y - 20)) 
\ No newline at end of file
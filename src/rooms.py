@@ -28,16 +28,37 @@ class Room:
         self.south: Optional[Room] = None
         self.east: Optional[Room] = None
         self.west: Optional[Room] = None
-            
+
+        # Pre-rendered backdrop, built lazily for the screen size it is
+        # first drawn at; a single blit then replaces the per-frame fill
+        self._bg_cache: Optional[pygame.Surface] = None
+
+    def _build_bg_cache(self, size: Tuple[int, int]) -> None:
+        """
+        Rasterize the room's static backdrop once at the given size.
+
+        Args:
+            size: The (width, height) of the screen being drawn to
+        """
+        bg = pygame.Surface(size)
+        bg.fill(self.background_color)
+        # Opaque backdrop: convert() to the display format when possible so
+        # the per-frame blit is a straight copy
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        self._bg_cache = bg
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draw the room and all its contents.
-        
+
         Args:
             screen: The Pygame surface to draw on
         """
-        # Draw background
-        screen.fill(self.background_color)
+        # Draw the cached backdrop, rebuilding it if the screen size changed
+        if self._bg_cache is None or self._bg_cache.get_size() != screen.get_size():
+            self._build_bg_cache(screen.get_size())
+        screen.blit(self._bg_cache, (0, 0))
 
 class RoomFactory:
     """
@@ -5,11 +5,26 @@ UI module for handling game interface elements.
 import pygame
 from typing import List, Dict, Any, Optional
 
+from src.fonts import get_font
+
 class UI:
     """
     Handles the user interface elements of the game.
     """
-    
+
+    # Main menu entries; immutable and shared by every UI instance
+    MENU_OPTIONS = ("Start Game", "Help", "Quit")
+
+    # OOP concepts shown on the victory screen; a class-level constant so
+    # the list isn't rebuilt every frame the screen is drawn
+    _CONCEPTS = (
+        "Classes: Blueprint templates for creating objects",
+        "Inheritance: Child classes inheriting from parent classes",
+        "Polymorphism: Different behavior based on object type",
+        "Encapsulation: Protecting data inside classes",
+        "Abstraction: Simplifying complex systems",
+    )
+
     def __init__(self, screen: pygame.Surface):
         """
         Initialize the UI manager.
@@ -20,13 +35,18 @@ class UI:
         self.screen = screen
         self.width = screen.get_width()
         self.height = screen.get_height()
-        
-        # Initialize fonts
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 48)
-        self.heading_font = pygame.font.SysFont('Arial', 32)
-        self.normal_font = pygame.font.SysFont('Arial', 24)
-        self.small_font = pygame.font.SysFont('Arial', 16)
+        # Layout anchors used by every screen, computed once
+        self._cx = self.width // 2
+        self._cy = self.height // 2
+        self._concept_ys = tuple(self._cy + 100 + i * 25
+                                 for i in range(len(self._CONCEPTS)))
+        
+        # Fonts come from the shared registry, so creating several UI
+        # instances (or a Game restart) reuses the same Font objects
+        self.title_font = get_font('Arial', 48)
+        self.heading_font = get_font('Arial', 32)
+        self.normal_font = get_font('Arial', 24)
+        self.small_font = get_font('Arial', 16)
         
         # Colors
         self.text_color = (255, 255, 255)
@@ -36,11 +56,195 @@ class UI:
         self.button_hover_color = (100, 100, 255)
         self.id_card_color = (40, 40, 40)  # Dark gray for ID card
         
-        # Menu options
-        self.menu_options = ["Start Game", "Help", "Quit"]
+        # Menu options (instance alias of the class-level tuple)
+        self.menu_options = self.MENU_OPTIONS
         self.selected_option = 0
-        
-    def draw_text(self, text: str, font: pygame.font.Font, color: tuple, x: int, y: int, 
+
+        # Rendered-text cache for draw_text; most UI strings repeat frame
+        # after frame, so rendering becomes a dict lookup. Bounded by a
+        # wholesale clear so dynamic strings (HP readouts) can't grow it
+        # without limit
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Cached inventory row composites (box, swatch, name, description),
+        # keyed by the item attributes that appear in the row so identical
+        # items share one surface and stale ids can't alias a new item
+        self._inv_row_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Per-glyph surfaces for the HUD readouts: the HP and level strings
+        # change too often for whole-string caching to hit, but they only
+        # ever use these characters, so they can be assembled glyph by glyph
+        self._small_glyphs = {ch: self._convert_text(self.small_font.render(ch, True, self.text_color))
+                              for ch in "0123456789/: HPLevl"}
+
+        # Reusable semi-transparent overlays; allocating and alpha-filling
+        # a screen-sized surface per frame is pure overhead when the
+        # overlay never changes
+        self._inv_overlay = self._make_overlay((self.width, self.height), (0, 0, 50), 220)
+        self._pause_overlay = self._make_overlay((self.width, self.height), (0, 0, 0), 180)
+        self._card_bg = self._make_overlay((200, 100), self.id_card_color, 220)
+        # The red "missing health" layer never changes, so it is baked into
+        # the card template; per frame only the green fill is blitted, at a
+        # width proportional to current health
+        pygame.draw.rect(self._card_bg, (255, 0, 0, 220), (10, 40, 180, 15))
+        self._hp_bar_fg = self._make_overlay((180, 15), (0, 255, 0), 255)
+
+        # Fixed ID card geometry; one Rect built here instead of a fresh
+        # position tuple per frame, plus a reusable area rect whose width
+        # is set to the current health before each green-bar blit
+        self._card_rect = pygame.Rect(self.width - 220, 20, 200, 100)
+        self._card_name_pos = (self._card_rect.x + 10, self._card_rect.y + 10)
+        self._hp_bar_pos = (self._card_rect.x + 10, self._card_rect.y + 40)
+        self._hp_bar_area = pygame.Rect(0, 0, 180, 15)
+        self._hp_text_pos = (self._card_rect.x + 10, self._card_rect.y + 60)
+        self._level_text_pos = (self._card_rect.right - 60, self._card_rect.y + 60)
+
+        # Static menu text, rendered once here so draw_menu is pure blits.
+        # Each entry pairs a surface with its centered destination rect
+        self._menu_static = []
+        for text, font, y in (
+            ("OOP Adventure Game", self.title_font, 100),
+            ("Learn Object-Oriented Programming while having fun!",
+             self.normal_font, 160),
+            ("Use UP/DOWN arrows to select, ENTER to confirm",
+             self.small_font, self.height - 100),
+            ("This game is built using Object-Oriented Programming concepts:",
+             self.small_font, self.height - 70),
+            ("Classes, Inheritance, Polymorphism, Encapsulation, and Abstraction",
+             self.small_font, self.height - 50),
+        ):
+            surf = font.render(text, True, self.text_color)
+            self._menu_static.append((surf, surf.get_rect(center=(self.width // 2, y))))
+
+        # Menu options carry a normal and a highlighted surface each, so
+        # selection changes are a choice between two cached surfaces
+        self._menu_option_surfs = []
+        for i, option in enumerate(self.menu_options):
+            normal = self._convert_text(self.heading_font.render(option, True, self.text_color))
+            highlight = self._convert_text(self.heading_font.render(option, True, self.highlight_color))
+            rect = normal.get_rect(center=(self.width // 2, 250 + i * 60))
+            self._menu_option_surfs.append((normal, highlight, rect))
+
+        # Pause menu text, pre-rendered with centered rects; drawn together
+        # with the overlay in a single batched blits call
+        self._pause_static = [(self._pause_overlay, (0, 0))]
+        for text, font, y in (
+            ("Game Paused", self.heading_font, self.height // 3),
+            ("Press ESC to resume", self.normal_font, self._cy),
+            ("Press Q to quit", self.normal_font, self._cy + 40),
+        ):
+            surf = self._convert_text(font.render(text, True, self.text_color))
+            self._pause_static.append((surf, surf.get_rect(center=(self._cx, y))))
+
+        # Fully composited backgrounds for the static screens, built lazily
+        # on first draw so they can be converted to the display format
+        self._menu_bg: Optional[pygame.Surface] = None
+        self._victory_bg: Optional[pygame.Surface] = None
+        self._game_over_bg: Optional[pygame.Surface] = None
+        
+    @staticmethod
+    def _convert_text(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Match a rendered text surface to the display pixel format so its
+        blits skip per-pixel conversion; returns the surface unchanged when
+        no display mode is set (headless tests).
+        """
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    @staticmethod
+    def _make_overlay(size: tuple, color: tuple, alpha: int) -> pygame.Surface:
+        """
+        Build a reusable semi-transparent overlay surface.
+
+        The alpha is baked into the pixels of an SRCALPHA surface rather
+        than applied through set_alpha, so SDL blits it on its optimized
+        per-pixel RGBA path; convert_alpha (when a display exists) matches
+        the display format so no per-blit conversion is left.
+
+        Args:
+            size: The (width, height) of the overlay
+            color: The RGB fill color
+            alpha: The overlay alpha (0-255), baked into the fill
+        """
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((*color, alpha))
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert_alpha()
+        return overlay
+
+    def _render_centered(self, target: pygame.Surface, text: str,
+                         font: pygame.font.Font, color: tuple, y: int) -> None:
+        """Render text horizontally centered at the given y onto a surface."""
+        surf = font.render(text, True, color)
+        target.blit(surf, surf.get_rect(center=(self._cx, y)))
+
+    def _build_menu_bg(self) -> None:
+        """Composite everything static on the menu into one surface."""
+        bg = pygame.Surface((self.width, self.height))
+        bg.fill(self.bg_color)
+        for surf, rect in self._menu_static:
+            bg.blit(surf, rect)
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        self._menu_bg = bg
+
+    def _build_victory_bg(self) -> None:
+        """Composite the victory screen (entirely static) into one surface."""
+        bg = pygame.Surface((self.width, self.height))
+        bg.fill((0, 50, 0))
+        self._render_centered(bg, "Victory!", self.title_font,
+                              self.highlight_color, self.height // 3)
+        self._render_centered(bg, "You have completed the adventure!",
+                              self.normal_font, self.text_color, self._cy)
+        self._render_centered(bg, "You've also learned about Object-Oriented Programming concepts:",
+                              self.normal_font, self.text_color, self._cy + 60)
+        for concept, y in zip(self._CONCEPTS, self._concept_ys):
+            self._render_centered(bg, concept, self.small_font,
+                                  self.highlight_color, y)
+        self._render_centered(bg, "Press R to play again", self.normal_font,
+                              self.text_color, self.height - 60)
+        self._render_centered(bg, "Press Q to quit", self.normal_font,
+                              self.text_color, self.height - 30)
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        self._victory_bg = bg
+
+    def _build_game_over_bg(self) -> None:
+        """Composite the game-over screen (entirely static) into one surface."""
+        bg = pygame.Surface((self.width, self.height))
+        bg.fill((50, 0, 0))
+        self._render_centered(bg, "Game Over", self.title_font,
+                              self.text_color, self.height // 3)
+        self._render_centered(bg, "Press R to restart", self.normal_font,
+                              self.text_color, self._cy)
+        self._render_centered(bg, "Press Q to quit", self.normal_font,
+                              self.text_color, self._cy + 40)
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        self._game_over_bg = bg
+
+    def _blit_string(self, text: str, x: int, y: int) -> None:
+        """
+        Draw a string from the pre-rendered small-font glyph table.
+
+        Only characters present in the table can be drawn; used for the
+        numeric HUD readouts so a changing value costs a few blits rather
+        than a font rasterization.
+
+        Args:
+            text: The text to draw (HUD characters only)
+            x, y: The position to draw at
+        """
+        glyphs = self._small_glyphs
+        screen = self.screen
+        for ch in text:
+            glyph = glyphs[ch]
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def draw_text(self, text: str, font: pygame.font.Font, color: tuple, x: int, y: int,
                  centered: bool = False) -> None:
         """
         Draw text on the screen.
@@ -52,7 +256,12 @@ class UI:
             x, y: The position to draw at
             centered: Whether to center the text at the given position
         """
-        text_surface = font.render(text, True, color)
+        key = (id(font), text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            text_surface = self._text_cache[key] = self._convert_text(font.render(text, True, color))
         if centered:
             text_rect = text_surface.get_rect(center=(x, y))
             self.screen.blit(text_surface, text_rect)
@@ -61,36 +270,14 @@ class UI:
             
     def draw_menu(self) -> None:
         """Draw the main menu screen."""
-        # Fill the background
-        self.screen.fill(self.bg_color)
-        
-        # Draw the title
-        self.draw_text("OOP Adventure Game", self.title_font, self.text_color, 
-                     self.width // 2, 100, centered=True)
-        
-        # Draw the tagline
-        self.draw_text("Learn Object-Oriented Programming while having fun!", 
-                     self.normal_font, self.text_color, 
-                     self.width // 2, 160, centered=True)
-        
-        # Draw the menu options
-        for i, option in enumerate(self.menu_options):
-            color = self.highlight_color if i == self.selected_option else self.text_color
-            self.draw_text(option, self.heading_font, color,
-                         self.width // 2, 250 + i * 60, centered=True)
-        
-        # Draw control instructions
-        self.draw_text("Use UP/DOWN arrows to select, ENTER to confirm", 
-                     self.small_font, self.text_color,
-                     self.width // 2, self.height - 100, centered=True)
-        
-        # Draw OOP concept explanation
-        self.draw_text("This game is built using Object-Oriented Programming concepts:",
-                     self.small_font, self.text_color,
-                     self.width // 2, self.height - 70, centered=True)
-        self.draw_text("Classes, Inheritance, Polymorphism, Encapsulation, and Abstraction",
-                     self.small_font, self.text_color,
-                     self.width // 2, self.height - 50, centered=True)
+        # One batched call covers the composited background plus the menu
+        # options, picking the highlighted surface for the current selection
+        if self._menu_bg is None:
+            self._build_menu_bg()
+        ops = [(self._menu_bg, (0, 0))]
+        for i, (normal, highlight, rect) in enumerate(self._menu_option_surfs):
+            ops.append((highlight if i == self.selected_option else normal, rect))
+        self.screen.blits(ops)
                      
     def draw_player_id_card(self, player: 'Player') -> None:
         """
@@ -99,42 +286,28 @@ class UI:
         Args:
             player: The player object to display info for
         """
-        # Card dimensions and position
-        card_width = 200
-        card_height = 100
-        card_x = self.width - card_width - 20
-        card_y = 20
-        
-        # Draw card background
-        card_surface = pygame.Surface((card_width, card_height))
-        card_surface.set_alpha(220)  # Semi-transparent
-        card_surface.fill(self.id_card_color)
-        self.screen.blit(card_surface, (card_x, card_y))
-        
+        # Draw card background (cached overlay, built once in __init__)
+        self.screen.blit(self._card_bg, self._card_rect.topleft)
+
         # Draw card border
-        pygame.draw.rect(self.screen, (100, 100, 100), (card_x, card_y, card_width, card_height), 2)
-        
-        # Draw player name
-        name_text = self.normal_font.render(player.name, True, self.highlight_color)
-        self.screen.blit(name_text, (card_x + 10, card_y + 10))
-        
-        # Draw health bar
-        health_pct = player.health / player._max_health
-        bar_width = 180
-        health_width = bar_width * health_pct
-        
-        # Health bar background (red)
-        pygame.draw.rect(self.screen, (255, 0, 0), (card_x + 10, card_y + 40, bar_width, 15))
-        # Health bar foreground (green)
-        pygame.draw.rect(self.screen, (0, 255, 0), (card_x + 10, card_y + 40, health_width, 15))
-        
-        # Draw health text
-        health_text = self.small_font.render(f"HP: {player.health}/{player._max_health}", True, self.text_color)
-        self.screen.blit(health_text, (card_x + 10, card_y + 60))
-        
-        # Draw level
-        level_text = self.small_font.render(f"Level: {player.level}", True, self.text_color)
-        self.screen.blit(level_text, (card_x + card_width - 60, card_y + 60))
+        pygame.draw.rect(self.screen, (100, 100, 100), self._card_rect, 2)
+
+        # Draw player name (served from the text cache)
+        self.draw_text(player.name, self.normal_font, self.highlight_color,
+                     self._card_name_pos[0], self._card_name_pos[1])
+
+        # Draw health bar foreground; the red background is part of the
+        # card template blitted above
+        health_width = (180 * player.health) // player._max_health
+        if health_width > 0:
+            self._hp_bar_area.width = health_width
+            self.screen.blit(self._hp_bar_fg, self._hp_bar_pos, area=self._hp_bar_area)
+
+        # Draw health and level readouts from the glyph table; these strings
+        # change whenever the player takes damage, so per-glyph blits beat
+        # re-rasterizing the whole string
+        self._blit_string(f"HP: {player.health}/{player._max_health}", *self._hp_text_pos)
+        self._blit_string(f"Level: {player.level}", *self._level_text_pos)
         
     def draw_player_stats(self, player: 'Player') -> None:
         """
@@ -146,6 +319,42 @@ class UI:
         # Only draw the ID card in top-right corner
         self.draw_player_id_card(player)
         
+    def draw_event_log(self, events, max_lines: int = 4) -> None:
+        """
+        Draw the most recent game events (combat messages etc.) above the
+        tutorial bar at the bottom-left of the screen.
+
+        Args:
+            events: An iterable of message strings, oldest first
+            max_lines: How many of the latest messages to show
+        """
+        recent = list(events)[-max_lines:]
+        y = self.height - 60 - 20 * len(recent)
+        for message in recent:
+            self.draw_text(message, self.small_font, self.text_color, 20, y)
+            y += 20
+
+    def _get_inventory_row(self, item: 'Item') -> pygame.Surface:
+        """
+        Return the cached row composite for an inventory item: the slot box
+        with the item's color swatch, name, and description baked in.
+
+        Args:
+            item: The item to build a row for
+        """
+        key = (item.name, item.description, item.consumable, item.color)
+        row = self._inv_row_cache.get(key)
+        if row is None:
+            row = pygame.Surface((self.width // 2, 80))
+            row.fill((50, 50, 100))
+            pygame.draw.rect(row, item.color, (20, 20, 40, 40))
+            row.blit(self.normal_font.render(item.name, True, self.text_color), (80, 15))
+            row.blit(self.small_font.render(item.description, True, self.text_color), (80, 45))
+            if pygame.display.get_surface() is not None:
+                row = row.convert()
+            self._inv_row_cache[key] = row
+        return row
+
     def draw_inventory(self, inventory: List['Item']) -> None:
         """
         Draw the player's inventory screen.
@@ -153,113 +362,55 @@ class UI:
         Args:
             inventory: The list of items in the player's inventory
         """
-        # Fill the background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 50))
-        self.screen.blit(overlay, (0, 0))
+        # Fill the background with the cached semi-transparent overlay
+        self.screen.blit(self._inv_overlay, (0, 0))
         
         # Draw title
-        self.draw_text("Inventory", self.heading_font, self.text_color, 
-                     self.width // 2, 50, centered=True)
+        self.draw_text("Inventory", self.heading_font, self.text_color,
+                     self._cx, 50, centered=True)
         
-        # Draw items
-        if not inventory:
+        # Draw items; the inventory is a fixed-size slot array where empty
+        # slots hold None
+        if not any(inventory):
             self.draw_text("Your inventory is empty.", self.normal_font, self.text_color,
-                         self.width // 2, self.height // 2, centered=True)
+                         self._cx, self._cy, centered=True)
         else:
+            # Collect cached row composites and batch them into one blits
+            # call; only the slot-number instructions are drawn per slot
+            rows = []
+            instructions = []
             item_y = 120
             for i, item in enumerate(inventory):
-                # Draw item box
-                pygame.draw.rect(self.screen, (50, 50, 100), 
-                               (self.width // 4, item_y, self.width // 2, 80))
-                
-                # Draw item color square
-                pygame.draw.rect(self.screen, item.color, 
-                               (self.width // 4 + 20, item_y + 20, 40, 40))
-                
-                # Draw item name and description
-                self.draw_text(item.name, self.normal_font, self.text_color,
-                             self.width // 4 + 80, item_y + 15)
-                self.draw_text(item.description, self.small_font, self.text_color,
-                             self.width // 4 + 80, item_y + 45)
-                
-                # Draw usage instruction
+                if item is None:
+                    continue
+                rows.append((self._get_inventory_row(item), (self.width // 4, item_y)))
                 consumable_text = "(Consumable)" if item.consumable else "(Equipment)"
-                self.draw_text(f"Press {i+1} to use {consumable_text}", self.small_font, 
-                             self.highlight_color, self.width // 4 + 300, item_y + 20)
-                
+                instructions.append((f"Press {i+1} to use {consumable_text}", item_y + 20))
                 item_y += 100
+            self.screen.blits(rows)
+            for text, y in instructions:
+                self.draw_text(text, self.small_font, self.highlight_color,
+                             self.width // 4 + 300, y)
                 
         # Draw instructions
         self.draw_text("Press I to close inventory", self.normal_font, self.text_color,
-                     self.width // 2, self.height - 50, centered=True)
+                     self._cx, self.height - 50, centered=True)
                      
     def draw_pause_menu(self) -> None:
         """Draw the pause menu."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Draw title
-        self.draw_text("Game Paused", self.heading_font, self.text_color,
-                     self.width // 2, self.height // 3, centered=True)
-        
-        # Draw options
-        self.draw_text("Press ESC to resume", self.normal_font, self.text_color,
-                     self.width // 2, self.height // 2, centered=True)
-        self.draw_text("Press Q to quit", self.normal_font, self.text_color,
-                     self.width // 2, self.height // 2 + 40, centered=True)
+        # Overlay and pre-rendered text in one batched call
+        self.screen.blits(self._pause_static)
                      
     def draw_game_over(self) -> None:
         """Draw the game over screen."""
-        # Fill screen with dark color
-        self.screen.fill((50, 0, 0))
-        
-        # Draw game over message
-        self.draw_text("Game Over", self.title_font, self.text_color,
-                     self.width // 2, self.height // 3, centered=True)
-        
-        # Draw restart instructions
-        self.draw_text("Press R to restart", self.normal_font, self.text_color,
-                     self.width // 2, self.height // 2, centered=True)
-        self.draw_text("Press Q to quit", self.normal_font, self.text_color,
-                     self.width // 2, self.height // 2 + 40, centered=True)
+        # The whole screen is static, pre-composited into one surface
+        if self._game_over_bg is None:
+            self._build_game_over_bg()
+        self.screen.blit(self._game_over_bg, (0, 0))
                      
     def draw_victory(self) -> None:
         """Draw the victory screen."""
-        # Fill screen with celebratory color
-        self.screen.fill((0, 50, 0))
-        
-        # Draw victory message
-        self.draw_text("Victory!", self.title_font, self.highlight_color,
-                     self.width // 2, self.height // 3, centered=True)
-        
-        # Draw congratulatory message
-        self.draw_text("You have completed the adventure!", self.normal_font, self.text_color,
-                     self.width // 2, self.height // 2, centered=True)
-        
-        # Draw OOP congratulations
-        self.draw_text("You've also learned about Object-Oriented Programming concepts:", 
-                     self.normal_font, self.text_color,
-                     self.width // 2, self.height // 2 + 60, centered=True)
-        
-        concepts = [
-            "Classes: Blueprint templates for creating objects",
-            "Inheritance: Child classes inheriting from parent classes",
-            "Polymorphism: Different behavior based on object type",
-            "Encapsulation: Protecting data inside classes",
-            "Abstraction: Simplifying complex systems"
-        ]
-        
-        for i, concept in enumerate(concepts):
-            self.draw_text(concept, self.small_font, self.highlight_color,
-                         self.width // 2, self.height // 2 + 100 + i * 25, centered=True)
-        
-        # Draw restart/quit instructions
-        self.draw_text("Press R to play again", self.normal_font, self.text_color,
-                     self.width // 2, self.height - 60, centered=True)
-        self.draw_text("Press Q to quit", self.normal_font, self.text_color,
-                     self.width // 2, self.height - 30, centered=True) 
\ No newline at end of file
+        # The whole screen is static, pre-composited into one surface
+        if self._victory_bg is None:
+            self._build_victory_bg()
+        self.screen.blit(self._victory_bg, (0, 0)) 
\ No newline at end of file
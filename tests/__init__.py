@@ -13,15 +13,30 @@ class GameTestCase(unittest.TestCase):
     Provides common setup and teardown functionality.
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole test process."""
+        # pygame.init loads every SDL subsystem; doing it per test method
+        # dominated suite wall time. There is deliberately no matching
+        # pygame.quit(): the shared font registry (src.fonts) caches Font
+        # objects at module scope, and a cached Font outliving a quit/init
+        # cycle crashes the interpreter on its next render
+        if not pygame.get_init():
+            pygame.init()
+        # One screen surface shared by the whole class; setUp clears it, so
+        # tests must not retain pixel state across methods
+        cls._shared_screen = pygame.Surface((800, 600))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the class's shared fixtures."""
+        del cls._shared_screen
+
     def setUp(self):
         """Set up test fixtures before each test method."""
-        pygame.init()
         self.screen_size: Tuple[int, int] = (800, 600)
-        self.screen = pygame.Surface(self.screen_size)
-        
-    def tearDown(self):
-        """Clean up after each test method."""
-        pygame.quit()
+        self.screen = self._shared_screen
+        self.screen.fill((0, 0, 0))
         
     def create_key_event(self, key: int, char: str = '') -> pygame.event.Event:
         """
@@ -65,9 +65,8 @@ class TestNPC(GameTestCase):
         """Test handling of keyboard input for messages."""
         self.npc.dialogue_active = True
         
-        # Test adding characters to message
-        for char in "Hello":
-            self.npc.handle_input(self.create_key_event(ord(char), char))
+        # Test adding text to message (bulk fast path, no per-character events)
+        self.npc.append_to_message("Hello")
         self.assertEqual(self.npc.current_message, "Hello")
         
         # Test backspace